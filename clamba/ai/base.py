@@ -3,7 +3,8 @@ Base AI Provider interface for CLAMBA
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 
 
 class AIProviderError(Exception):
@@ -33,6 +34,10 @@ class BaseAIProvider(ABC):
     All AI providers must implement this interface to be used with CLAMBA
     """
 
+    # Default cap on simultaneous requests sent by query_batch; a local
+    # Ollama server processes few requests in parallel and queues the rest
+    max_concurrent_requests: int = 4
+
     def __init__(self, config: Any):
         """
         Initialize the AI provider
@@ -59,6 +64,38 @@ class BaseAIProvider(ABC):
         """
         pass
 
+    def query_batch(
+        self, prompts: List[str], max_workers: Optional[int] = None, **kwargs
+    ) -> List[str]:
+        """
+        Send several prompts to the AI provider concurrently
+        
+        Prompts are submitted as-is (no client-side padding or merging) so
+        the server can schedule them independently. At most max_workers
+        requests are in flight at once; the rest wait for a free slot.
+        
+        Args:
+            prompts: Prompts to send
+            max_workers: Maximum concurrent requests (defaults to the
+                provider's max_concurrent_requests)
+            **kwargs: Additional parameters passed to query()
+            
+        Returns:
+            AI responses, in the same order as prompts
+            
+        Raises:
+            AIProviderError: If any query fails
+        """
+        if not prompts:
+            return []
+        if len(prompts) == 1:
+            return [self.query(prompts[0], **kwargs)]
+        
+        max_workers = min(max_workers or self.max_concurrent_requests, len(prompts))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self.query, prompt, **kwargs) for prompt in prompts]
+            return [future.result() for future in futures]
+
     @abstractmethod
     def test_connection(self) -> bool:
         """
@@ -2,13 +2,19 @@
 AI Provider Factory for CLAMBA
 """
 
-from typing import Union
+import threading
+from typing import Dict, Tuple, Union
 
 from ..config.settings import CLAMBAConfig
 from .base import BaseAIProvider
 from .ollama import OllamaProvider
 
 
+# Providers shared by get_provider_cached, keyed by provider name and settings
+_provider_cache: Dict[Tuple[str, str], BaseAIProvider] = {}
+_provider_cache_lock = threading.Lock()
+
+
 class AIProviderFactory:
     """Factory for creating AI providers"""
 
@@ -58,6 +64,36 @@ class AIProviderFactory:
         else:
             raise ValueError(f"Unsupported AI provider: {provider_name}")
 
+    @staticmethod
+    def get_provider_cached(config: CLAMBAConfig) -> BaseAIProvider:
+        """
+        Get a shared AI provider for this configuration
+        
+        Providers are reused across calls with the same provider name and
+        provider settings, so their HTTP sessions and warmed-up connections
+        are shared within the process.
+        
+        Args:
+            config: CLAMBA configuration
+            
+        Returns:
+            AI provider instance
+            
+        Raises:
+            ValueError: If provider is not supported or configuration is invalid
+        """
+        provider_name = config.ai.provider.lower()
+        provider_config = getattr(config.ai, provider_name, None)
+        settings = provider_config.model_dump_json() if provider_config is not None else ""
+        key = (provider_name, settings)
+        
+        with _provider_cache_lock:
+            provider = _provider_cache.get(key)
+            if provider is None:
+                provider = AIProviderFactory.create_provider(config)
+                _provider_cache[key] = provider
+        return provider
+
     @staticmethod
     def get_available_providers() -> list[str]:
         """Get list of available AI providers"""
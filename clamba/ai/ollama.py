@@ -2,11 +2,10 @@
 Ollama AI Provider for CLAMBA
 """
 
+import threading
 import time
 from typing import Any, Dict
 
-import requests
-
 from ..config.settings import OllamaConfig
 from ..utils.logger import get_logger
 from .base import (
@@ -18,6 +17,12 @@ from .base import (
 )
 
 
+def _requests():
+    """Import and return requests (deferred so importing clamba stays light)"""
+    import requests
+    return requests
+
+
 class OllamaProvider(BaseAIProvider):
     """
     Ollama AI provider for local AI models
@@ -39,9 +44,23 @@ class OllamaProvider(BaseAIProvider):
         self.generate_url = f"{config.url.rstrip('/')}/api/generate"
         self.tags_url = f"{config.url.rstrip('/')}/api/tags"
         
+        # HTTP sessions keep connections alive between calls. requests.Session
+        # is not documented as thread-safe and the provider is shared by
+        # query_batch and batch analysis workers, so each thread gets its own,
+        # created on its first request
+        self._local = threading.local()
+        
         self.logger.info(f"Ollama provider initialized: {config.url}")
         self.logger.info(f"Model: {config.model}")
 
+    @property
+    def session(self):
+        """HTTP session of the calling thread for this provider"""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = _requests().Session()
+        return session
+
     def query(self, prompt: str, **kwargs) -> str:
         """
         Send query to Ollama
@@ -73,6 +92,8 @@ class OllamaProvider(BaseAIProvider):
         if "top_k" in kwargs:
             payload["options"]["top_k"] = kwargs["top_k"]
         
+        requests = _requests()
+        
         retry_settings = self.get_retry_settings()
         max_retries = retry_settings["max_retries"]
         retry_delay = retry_settings["retry_delay"]
@@ -82,7 +103,7 @@ class OllamaProvider(BaseAIProvider):
             try:
                 self.logger.debug(f"Ollama query attempt {attempt + 1}/{max_retries}")
                 
-                response = requests.post(
+                response = self.session.post(
                     self.generate_url,
                     json=payload,
                     timeout=self.config.timeout
@@ -143,8 +164,10 @@ class OllamaProvider(BaseAIProvider):
         Returns:
             True if connection successful
         """
+        requests = _requests()
+        
         try:
-            response = requests.get(self.tags_url, timeout=10)
+            response = self.session.get(self.tags_url, timeout=10)
             
             if response.status_code == 200:
                 # Check if our model is available
@@ -177,7 +200,7 @@ class OllamaProvider(BaseAIProvider):
             Model information dictionary
         """
         try:
-            response = requests.get(self.tags_url, timeout=10)
+            response = self.session.get(self.tags_url, timeout=10)
             
             if response.status_code == 200:
                 models = response.json().get("models", [])
@@ -207,7 +230,7 @@ class OllamaProvider(BaseAIProvider):
             List of model names
         """
         try:
-            response = requests.get(self.tags_url, timeout=10)
+            response = self.session.get(self.tags_url, timeout=10)
             
             if response.status_code == 200:
                 models = response.json().get("models", [])
@@ -234,7 +257,7 @@ class OllamaProvider(BaseAIProvider):
             
             self.logger.info(f"Pulling model: {model_name}")
             
-            response = requests.post(pull_url, json=payload, timeout=300)  # 5 minutes timeout
+            response = self.session.post(pull_url, json=payload, timeout=300)  # 5 minutes timeout
             
             if response.status_code == 200:
                 self.logger.info(f"✅ Model '{model_name}' pulled successfully")
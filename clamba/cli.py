@@ -189,6 +189,7 @@ def batch(
     config: Optional[str] = typer.Option(None, "--config", "-c", help="Configuration file path"),
     pattern: str = typer.Option("*.pdf", "--pattern", "-p", help="File pattern to match"),
     provider: Optional[str] = typer.Option(None, "--provider", help="AI provider override"),
+    workers: int = typer.Option(1, "--workers", "-w", min=1, help="Contracts analyzed in parallel"),
     debug: bool = typer.Option(False, "--debug", "-d", help="Enable debug mode"),
 ):
     """
@@ -238,7 +239,8 @@ def batch(
     try:
         results = analyzer.analyze_multiple_contracts(
             pdf_paths=pdf_files,
-            output_dir=output_path
+            output_dir=output_path,
+            max_workers=workers,
         )
         
         console.print(f"✅ Batch analysis completed: {len(results)}/{len(pdf_files)} successful", style="green")
@@ -9,8 +9,10 @@ from .settings import (
     OpenAIConfig,
     AnthropicConfig,
     AnalysisConfig,
+    PDFConfig,
     OutputConfig,
     load_config,
+    load_config_cached,
     get_default_config,
     create_sample_config,
 )
@@ -22,8 +24,10 @@ __all__ = [
     "OpenAIConfig",
     "AnthropicConfig",
     "AnalysisConfig",
+    "PDFConfig",
     "OutputConfig",
     "load_config",
+    "load_config_cached",
     "get_default_config",
     "create_sample_config",
 ]
\ No newline at end of file
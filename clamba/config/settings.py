@@ -3,6 +3,7 @@ Configuration settings for CLAMBA
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Literal, Optional, Union
 
@@ -103,6 +104,19 @@ class AnalysisConfig(BaseModel):
         return v
 
 
+class PDFConfig(BaseModel):
+    """PDF extraction configuration"""
+    
+    backend: Literal["pypdf2", "pymupdf"] = Field(
+        default="pypdf2",
+        description="Text extraction backend (pymupdf requires clamba[pdf], AGPL)"
+    )
+    cache_text: bool = Field(
+        default=True,
+        description="Cache extracted PDF text on disk (~/.cache/clamba)"
+    )
+
+
 class OutputConfig(BaseModel):
     """Output configuration"""
     
@@ -129,6 +143,7 @@ class CLAMBAConfig(BaseSettings):
     
     ai: AIConfig = Field(default_factory=AIConfig)
     analysis: AnalysisConfig = Field(default_factory=AnalysisConfig)
+    pdf: PDFConfig = Field(default_factory=PDFConfig)
     output: OutputConfig = Field(default_factory=OutputConfig)
     debug: bool = Field(default=False, description="Enable debug mode")
 
@@ -237,6 +252,29 @@ def load_config(config_path: Optional[Union[str, Path]] = None) -> CLAMBAConfig:
     return CLAMBAConfig()
 
 
+@lru_cache(maxsize=8)
+def _load_config_file(resolved_path: str, mtime_ns: int) -> CLAMBAConfig:
+    """Parse a configuration file; mtime_ns is only part of the cache key"""
+    return CLAMBAConfig.from_file(resolved_path)
+
+
+def load_config_cached(config_path: Union[str, Path]) -> CLAMBAConfig:
+    """
+    Load configuration from YAML file, reusing the parsed result
+    
+    The cache is keyed on the resolved path and the file's modification
+    time, so editing the file is picked up on the next call. The returned
+    instance is shared between callers and must not be mutated.
+    """
+    config_path = Path(config_path)
+    
+    if not config_path.exists():
+        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+    
+    resolved_path = config_path.resolve()
+    return _load_config_file(str(resolved_path), resolved_path.stat().st_mtime_ns)
+
+
 def create_sample_config(output_path: Union[str, Path] = "clamba_config.yaml") -> None:
     """Create a sample configuration file"""
     
@@ -280,6 +318,13 @@ analysis:
   max_steps_per_process: 7
   cycle_detection: true
 
+# Configuration de l'extraction PDF
+pdf:
+  # Moteur d'extraction : "pypdf2" ou "pymupdf" (plus rapide, pip install clamba[pdf], licence AGPL)
+  backend: "pypdf2"
+  # Cache du texte extrait dans ~/.cache/clamba (désactiver pour les contrats confidentiels)
+  cache_text: true
+
 # Configuration de sortie
 output:
   include_metadata: true
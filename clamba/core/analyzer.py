@@ -3,9 +3,15 @@ Main analyzer for CLAMBA - Smart Legal Contract Automaton Generator
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from ..ai.factory import AIProviderFactory
 from ..config.settings import CLAMBAConfig
@@ -17,6 +23,29 @@ from .pdf_extractor import PDFExtractor
 from .process_detector import ProcessDetector
 
 
+def _write_json(data: Any, output_path: Path, pretty_print: bool = True) -> None:
+    """
+    Write data as JSON, with orjson when installed (pip install clamba[json])
+    
+    Args:
+        data: JSON-serializable data
+        output_path: Output file path
+        pretty_print: Indent with 2 spaces
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty_print:
+            option |= orjson.OPT_INDENT_2
+        output_path.write_bytes(orjson.dumps(data, option=option))
+        return
+    
+    with open(output_path, "w", encoding="utf-8") as f:
+        if pretty_print:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        else:
+            json.dump(data, f, ensure_ascii=False)
+
+
 class CLAMBAAnalyzer:
     """
     Main analyzer for generating Smart Legal Contract Automatons
@@ -39,7 +68,10 @@ class CLAMBAAnalyzer:
         self.logger = get_logger(__name__, debug=config.debug)
         
         # Initialize components
-        self.pdf_extractor = PDFExtractor()
+        self.pdf_extractor = PDFExtractor(
+            backend=config.pdf.backend,
+            use_cache=config.pdf.cache_text,
+        )
         self.ai_provider = AIProviderFactory.create_provider(config)
         self.process_detector = ProcessDetector(self.ai_provider, config)
         self.validator = ResultValidator()
@@ -267,11 +299,7 @@ class CLAMBAAnalyzer:
             with open(output_path, "w", encoding="utf-8") as f:
                 yaml.dump(export_data, f, default_flow_style=False, indent=2)
         else:  # JSON
-            with open(output_path, "w", encoding="utf-8") as f:
-                if self.config.output.pretty_print:
-                    json.dump(export_data, f, indent=2, ensure_ascii=False)
-                else:
-                    json.dump(export_data, f, ensure_ascii=False)
+            _write_json(export_data, output_path, self.config.output.pretty_print)
         
         self.logger.info(f"💾 Result saved to: {output_path}")
 
@@ -280,14 +308,20 @@ class CLAMBAAnalyzer:
         pdf_paths: List[Union[str, Path]],
         output_dir: Union[str, Path],
         contract_types: Optional[Dict[str, ContractType]] = None,
+        max_workers: int = 1,
     ) -> List[ContractResult]:
         """
         Analyze multiple contracts in batch
         
+        Contracts are independent, so with max_workers > 1 they are analyzed
+        concurrently in threads (the work is dominated by AI requests).
+        Results and the batch summary keep the order of pdf_paths.
+        
         Args:
             pdf_paths: List of PDF file paths
             output_dir: Output directory for results
             contract_types: Optional mapping of file names to contract types
+            max_workers: Number of contracts analyzed concurrently
             
         Returns:
             List of contract analysis results
@@ -295,33 +329,24 @@ class CLAMBAAnalyzer:
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        results = []
         contract_types = contract_types or {}
+        pdf_paths = [Path(pdf_path) for pdf_path in pdf_paths]
         
         self.logger.info(f"🔄 Starting batch analysis of {len(pdf_paths)} contracts")
         
-        for i, pdf_path in enumerate(pdf_paths, 1):
-            pdf_path = Path(pdf_path)
-            
+        def process(indexed_path) -> Optional[ContractResult]:
+            i, pdf_path = indexed_path
             self.logger.info(f"📄 Processing {i}/{len(pdf_paths)}: {pdf_path.name}")
-            
-            try:
-                # Get contract type for this file
-                contract_type = contract_types.get(pdf_path.name)
-                
-                # Analyze contract
-                result = self.analyze_contract(pdf_path, contract_type)
-                results.append(result)
-                
-                # Save individual result
-                output_file = output_dir / f"{pdf_path.stem}_automates.json"
-                self.save_result(result, output_file)
-                
-                self.logger.info(f"✅ Completed {pdf_path.name}")
-                
-            except Exception as e:
-                self.logger.error(f"❌ Failed to process {pdf_path.name}: {str(e)}")
-                continue
+            return self._analyze_and_save(pdf_path, output_dir, contract_types.get(pdf_path.name))
+        
+        indexed_paths = list(enumerate(pdf_paths, 1))
+        if max_workers > 1 and len(pdf_paths) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                outcomes = list(executor.map(process, indexed_paths))
+        else:
+            outcomes = [process(indexed_path) for indexed_path in indexed_paths]
+        
+        results = [result for result in outcomes if result is not None]
         
         # Save batch summary
         summary = {
@@ -344,14 +369,44 @@ class CLAMBAAnalyzer:
         }
         
         summary_file = output_dir / "batch_summary.json"
-        with open(summary_file, "w", encoding="utf-8") as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False)
+        _write_json(summary, summary_file)
         
         self.logger.info(f"🎊 Batch analysis completed: {len(results)}/{len(pdf_paths)} successful")
         self.logger.info(f"📊 Summary saved to: {summary_file}")
         
         return results
 
+    def _analyze_and_save(
+        self,
+        pdf_path: Path,
+        output_dir: Path,
+        contract_type: Optional[ContractType],
+    ) -> Optional[ContractResult]:
+        """
+        Analyze one contract of a batch and save its result
+        
+        Args:
+            pdf_path: Path to the PDF contract
+            output_dir: Output directory for results
+            contract_type: Optional contract type
+            
+        Returns:
+            Contract analysis result, or None if the analysis failed
+        """
+        try:
+            result = self.analyze_contract(pdf_path, contract_type)
+            
+            # Save individual result
+            output_file = output_dir / f"{pdf_path.stem}_automates.json"
+            self.save_result(result, output_file)
+            
+            self.logger.info(f"✅ Completed {pdf_path.name}")
+            return result
+            
+        except Exception as e:
+            self.logger.error(f"❌ Failed to process {pdf_path.name}: {str(e)}")
+            return None
+
     def get_supported_contract_types(self) -> List[ContractType]:
         """Get list of supported contract types"""
         return list(ContractType)
@@ -2,29 +2,98 @@
 PDF text extraction utilities for CLAMBA
 """
 
+import importlib.util
 from pathlib import Path
-from typing import Optional
-
-import PyPDF2
+from typing import Callable, Iterator, Optional
 
+from ..utils.cache import pdf_text_cache
 from ..utils.logger import get_logger
 
 
+PDF_BACKENDS = ("pypdf2", "pymupdf")
+
+# Contracts already in plain text are read as-is, without any PDF parsing
+PLAIN_TEXT_SUFFIXES = (".txt", ".md")
+
+# Graphics-heavy page heuristic: a content stream larger than this, with no
+# text-showing operator in its first GRAPHICS_PEEK_BYTES, is treated as a drawing
+GRAPHICS_HEAVY_MIN_BYTES = 200 * 1024
+GRAPHICS_PEEK_BYTES = 4096
+
+# PDF libraries are imported on first use so that importing clamba (CLI,
+# config and model code) does not pay for them
+_PYMUPDF_AVAILABLE = importlib.util.find_spec("fitz") is not None
+
+
+def _pypdf2():
+    """Import and return the PyPDF2 module"""
+    import PyPDF2
+    return PyPDF2
+
+
+def _fitz():
+    """Import and return the PyMuPDF (fitz) module"""
+    import fitz
+    return fitz
+
+
 class PDFExtractor:
     """
     PDF text extractor with robust error handling
+    
+    Text is extracted with PyPDF2 by default. PyMuPDF (pip install clamba[pdf],
+    AGPL-licensed) is faster but opt-in with backend="pymupdf", so extracted
+    text never depends on which packages happen to be installed.
     """
     
-    def __init__(self):
-        """Initialize PDF extractor"""
+    def __init__(
+        self,
+        backend: str = "pypdf2",
+        skip_graphics_heavy: bool = False,
+        use_cache: bool = True,
+    ):
+        """
+        Initialize PDF extractor
+        
+        Args:
+            backend: Extraction backend ("pypdf2" or "pymupdf")
+            skip_graphics_heavy: Skip pages whose content stream looks like a
+                large drawing with no text (diagrams, scanned annexes)
+            use_cache: Cache extracted text on disk (see pdf_text_cache);
+                disable for confidential documents
+        """
         self.logger = get_logger(__name__)
+        self.skip_graphics_heavy = skip_graphics_heavy
+        self.use_cache = use_cache
+        
+        if backend not in PDF_BACKENDS:
+            raise ValueError(f"Unknown PDF backend: {backend}. Available: {', '.join(PDF_BACKENDS)}")
+        if backend == "pymupdf" and not _PYMUPDF_AVAILABLE:
+            raise ValueError(
+                "PyMuPDF backend requires 'pymupdf' package. "
+                "Install with: pip install clamba[pdf]"
+            )
+        self.backend = backend
+    
+    @property
+    def cache_tag(self) -> str:
+        """Backend, version and options, part of the on-disk text cache key"""
+        if self.backend == "pymupdf":
+            tag = f"pymupdf-{_fitz().VersionBind}"
+        else:
+            tag = f"pypdf2-{_pypdf2().__version__}"
+        return f"{tag}-skipgfx" if self.skip_graphics_heavy else tag
     
     def extract_text(self, pdf_path: Path) -> str:
         """
         Extract text from PDF file
         
+        PDF results are cached on disk by file content unless use_cache is
+        off (see pdf_text_cache).
+        Plain-text contracts (.txt, .md) are returned as-is.
+        
         Args:
-            pdf_path: Path to PDF file
+            pdf_path: Path to PDF or plain-text file
             
         Returns:
             Extracted text
@@ -32,6 +101,37 @@ class PDFExtractor:
         Raises:
             ValueError: If PDF cannot be read or no text extracted
         """
+        pdf_path = Path(pdf_path)
+        if pdf_path.suffix.lower() in PLAIN_TEXT_SUFFIXES:
+            return self._read_plain_text(pdf_path)
+        return self._extract_pdf_text(pdf_path)
+    
+    def _read_plain_text(self, text_path: Path) -> str:
+        """
+        Read a plain-text contract
+        
+        Args:
+            text_path: Path to .txt or .md file
+            
+        Returns:
+            File content, stripped
+            
+        Raises:
+            ValueError: If the file is empty
+        """
+        if not text_path.exists():
+            raise FileNotFoundError(f"Text file not found: {text_path}")
+        
+        text = text_path.read_text(encoding="utf-8").strip()
+        if not text:
+            raise ValueError(f"No text found in file: {text_path}")
+        
+        self.logger.info(f"Read {len(text)} characters from plain-text file")
+        return text
+    
+    @pdf_text_cache
+    def _extract_pdf_text(self, pdf_path: Path) -> str:
+        """Extract and join the text of every page of a PDF file"""
         if not pdf_path.exists():
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
         
@@ -39,34 +139,170 @@ class PDFExtractor:
             raise ValueError(f"File is not a PDF: {pdf_path}")
         
         try:
+            page_texts = []
+            page_count = 0
+            for page_text in self._iter_page_texts(pdf_path):
+                page_count += 1
+                if page_text:
+                    page_texts.append(page_text)
+            
+            text = "\n".join(page_texts)
+            
+            if not text.strip():
+                raise ValueError("No text could be extracted from PDF")
+            
+            self.logger.info(f"Extracted {len(text)} characters from {page_count} pages")
+            return text.strip()
+            
+        except _pypdf2().errors.PdfReadError as e:
+            raise ValueError(f"Invalid or corrupted PDF file: {str(e)}")
+        except Exception as e:
+            raise ValueError(f"Failed to extract text from PDF: {str(e)}")
+    
+    def extract_text_stream(self, pdf_path: Path, max_chars: Optional[int] = None) -> Iterator[str]:
+        """
+        Extract text from PDF file page by page
+        
+        Pages are only parsed as they are consumed, so callers that need the
+        beginning of a contract do not pay for the whole document. Results
+        are not cached. Plain-text contracts (.txt, .md) are yielded whole.
+        
+        Args:
+            pdf_path: Path to PDF or plain-text file
+            max_chars: Stop after the page where this many characters have
+                been yielded (None reads every page)
+            
+        Yields:
+            Text of each non-empty page, newline-terminated
+            
+        Raises:
+            ValueError: If PDF cannot be read
+        """
+        pdf_path = Path(pdf_path)
+        if pdf_path.suffix.lower() in PLAIN_TEXT_SUFFIXES:
+            yield self._read_plain_text(pdf_path) + "\n"
+            return
+        
+        if not pdf_path.exists():
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        
+        if not pdf_path.suffix.lower() == '.pdf':
+            raise ValueError(f"File is not a PDF: {pdf_path}")
+        
+        pages = self._iter_page_texts(pdf_path)
+        collected = 0
+        try:
+            for page_text in pages:
+                if not page_text:
+                    continue
+                
+                yield page_text + "\n"
+                collected += len(page_text) + 1
+                if max_chars is not None and collected >= max_chars:
+                    return
+        except _pypdf2().errors.PdfReadError as e:
+            raise ValueError(f"Invalid or corrupted PDF file: {str(e)}")
+        except Exception as e:
+            raise ValueError(f"Failed to extract text from PDF: {str(e)}")
+        finally:
+            pages.close()
+    
+    def _iter_page_texts(self, pdf_path: Path) -> Iterator[str]:
+        """
+        Yield the text of each page with the configured backend
+        
+        Args:
+            pdf_path: Path to PDF file
+            
+        Yields:
+            Page text, empty string when a page has none
+            
+        Raises:
+            ValueError: If the PDF has no pages
+        """
+        if self.backend == "pymupdf":
+            with _fitz().open(pdf_path) as doc:
+                if doc.page_count == 0:
+                    raise ValueError("PDF file has no pages")
+                
+                for page_num, page in enumerate(doc):
+                    if self.skip_graphics_heavy and self._is_graphics_heavy(page_num, page.read_contents):
+                        yield ""
+                        continue
+                    yield self._page_text(page_num, lambda: page.get_text("text"))
+        else:
             with open(pdf_path, 'rb') as file:
-                reader = PyPDF2.PdfReader(file)
+                reader = _pypdf2().PdfReader(file)
                 
                 if len(reader.pages) == 0:
                     raise ValueError("PDF file has no pages")
                 
-                text = ""
                 for page_num, page in enumerate(reader.pages):
-                    try:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text += page_text + "\n"
-                        else:
-                            self.logger.warning(f"No text extracted from page {page_num + 1}")
-                    except Exception as e:
-                        self.logger.warning(f"Failed to extract text from page {page_num + 1}: {str(e)}")
+                    if self.skip_graphics_heavy and self._is_graphics_heavy(
+                        page_num, lambda: self._pypdf2_contents(page)
+                    ):
+                        yield ""
                         continue
-                
-                if not text.strip():
-                    raise ValueError("No text could be extracted from PDF")
-                
-                self.logger.info(f"Extracted {len(text)} characters from {len(reader.pages)} pages")
-                return text.strip()
-                
-        except PyPDF2.errors.PdfReadError as e:
-            raise ValueError(f"Invalid or corrupted PDF file: {str(e)}")
+                    yield self._page_text(page_num, page.extract_text)
+    
+    @staticmethod
+    def _pypdf2_contents(page) -> bytes:
+        """Raw content stream of a PyPDF2 page"""
+        contents = page.get_contents()
+        return contents.get_data() if contents is not None else b""
+    
+    def _is_graphics_heavy(self, page_num: int, read_contents: Callable[[], bytes]) -> bool:
+        """
+        Check whether a page looks like a large drawing with no text
+        
+        Only the start of the content stream is scanned for the Tj/TJ
+        text-showing operators, so the check is far cheaper than extraction.
+        
+        Args:
+            page_num: Zero-based page index
+            read_contents: Callable returning the page's raw content stream
+            
+        Returns:
+            True if the page should be skipped
+        """
+        try:
+            contents = read_contents()
+        except Exception:
+            return False
+        
+        if len(contents) <= GRAPHICS_HEAVY_MIN_BYTES:
+            return False
+        
+        head = contents[:GRAPHICS_PEEK_BYTES]
+        if b"Tj" in head or b"TJ" in head:
+            return False
+        
+        self.logger.info(
+            f"Skipping graphics-heavy page {page_num + 1} ({len(contents)} bytes of drawing operators)"
+        )
+        return True
+    
+    def _page_text(self, page_num: int, extract: Callable[[], str]) -> str:
+        """
+        Run a page extraction, logging empty or failing pages
+        
+        Args:
+            page_num: Zero-based page index
+            extract: Callable returning the page text
+            
+        Returns:
+            Page text, empty string on failure
+        """
+        try:
+            page_text = extract()
         except Exception as e:
-            raise ValueError(f"Failed to extract text from PDF: {str(e)}")
+            self.logger.warning(f"Failed to extract text from page {page_num + 1}: {str(e)}")
+            return ""
+        
+        if not page_text:
+            self.logger.warning(f"No text extracted from page {page_num + 1}")
+            return ""
+        return page_text
     
     def get_pdf_info(self, pdf_path: Path) -> dict:
         """
@@ -87,6 +323,8 @@ class PDFExtractor:
         }
         
         try:
+            PyPDF2 = _pypdf2()
+            
             # File size
             info["file_size"] = pdf_path.stat().st_size
             
@@ -123,6 +361,8 @@ class PDFExtractor:
         Returns:
             Tuple of (is_valid, error_message)
         """
+        PyPDF2 = _pypdf2()
+        
         try:
             # Check file exists
             if not pdf_path.exists():
@@ -14,6 +14,35 @@ from ..models.process import Process, ProcessAnalysisResult, ProcessType
 from ..utils.logger import get_logger
 
 
+# Fallback pattern for a complete JSON array of objects in an AI response
+_JSON_ARRAY_PATTERN = re.compile(r'\[\s*\{.*?\}\s*(?:,\s*\{.*?\}\s*)*\]', re.DOTALL)
+
+
+# Process examples injected into the detection prompt per contract type
+_CONTRACT_TYPE_EXAMPLES = {
+    ContractType.LOGISTICS: """
+EXEMPLES PROCESSUS LOGISTIQUE:
+- Processus réception marchandises
+- Processus manutention/stockage  
+- Processus douanier/administrative
+- Processus facturation/paiement""",
+    
+    ContractType.SALES: """
+EXEMPLES PROCESSUS VENTE:
+- Processus préparation produit
+- Processus paiement échelonné
+- Processus livraison/réception
+- Processus garantie/SAV""",
+    
+    ContractType.SERVICE: """
+EXEMPLES PROCESSUS PRESTATION:
+- Processus qualification besoin
+- Processus exécution prestation
+- Processus validation livrables
+- Processus facturation""",
+}
+
+
 class ProcessDetector:
     """
     Business process detector using AI
@@ -113,30 +142,6 @@ class ProcessDetector:
     ) -> str:
         """Build AI prompt for process detection"""
         
-        # Contract type examples
-        type_examples = {
-            ContractType.LOGISTICS: """
-EXEMPLES PROCESSUS LOGISTIQUE:
-- Processus réception marchandises
-- Processus manutention/stockage  
-- Processus douanier/administrative
-- Processus facturation/paiement""",
-            
-            ContractType.SALES: """
-EXEMPLES PROCESSUS VENTE:
-- Processus préparation produit
-- Processus paiement échelonné
-- Processus livraison/réception
-- Processus garantie/SAV""",
-            
-            ContractType.SERVICE: """
-EXEMPLES PROCESSUS PRESTATION:
-- Processus qualification besoin
-- Processus exécution prestation
-- Processus validation livrables
-- Processus facturation""",
-        }
-        
         # Truncate contract text if too long
         max_contract_length = 6000
         if len(contract_text) > max_contract_length:
@@ -156,7 +161,7 @@ MÉTHODOLOGIE UNIVERSELLE:
 4. SÉPARER les processus qui peuvent s'exécuter en parallèle
 5. IGNORER les clauses juridiques pures (résiliation, juridiction, etc.)
 
-{type_examples.get(contract_type, "") if contract_type else ""}
+{_CONTRACT_TYPE_EXAMPLES.get(contract_type, "") if contract_type else ""}
 
 RÈGLES UNIVERSELLES:
 - Minimum {self.config.analysis.min_processes} processus, maximum {self.config.analysis.max_processes} processus
@@ -186,13 +191,14 @@ ANALYSER LE CONTRAT ET IDENTIFIER LES PROCESSUS MÉTIER DISTINCTS:"""
     def _build_dependency_prompt(self, processes: List[Process]) -> str:
         """Build AI prompt for dependency analysis"""
         
-        processes_info = ""
-        for p in processes:
-            processes_info += f"PROCESSUS {p.id}: {p.name}\n"
-            processes_info += f"   Description: {p.description}\n"
-            processes_info += f"   Étapes: {p.steps}\n"
-            processes_info += f"   Responsable: {p.responsible_party}\n"
-            processes_info += f"   Déclencheur: {p.triggers}\n\n"
+        processes_info = "".join(
+            f"PROCESSUS {p.id}: {p.name}\n"
+            f"   Description: {p.description}\n"
+            f"   Étapes: {p.steps}\n"
+            f"   Responsable: {p.responsible_party}\n"
+            f"   Déclencheur: {p.triggers}\n\n"
+            for p in processes
+        )
         
         prompt = f"""Tu es un EXPERT EN ORCHESTRATION DE PROCESSUS MÉTIER.
 
@@ -308,35 +314,25 @@ ANALYSER LES DÉPENDANCES LOGIQUES:"""
                     
                     # Vérifier que c'est du JSON valide
                     try:
-                        import json
                         json.loads(json_candidate)
                         return json_candidate
                     except json.JSONDecodeError:
                         continue
         
         # Méthode 2: Regex fallback
-        import re
-        
-        # Pattern pour JSON array complet
-        pattern = r'\[\s*\{.*?\}\s*(?:,\s*\{.*?\}\s*)*\]'
-        matches = re.findall(pattern, text, re.DOTALL)
-        
-        for match in matches:
+        for match in _JSON_ARRAY_PATTERN.findall(text):
             try:
-                import json
                 json.loads(match)
                 return match
             except json.JSONDecodeError:
                 continue
         
         # Méthode 3: Simple extraction entre [ et ]
-        if '[' in text and ']' in text:
-            start = text.find('[')
-            end = text.rfind(']') + 1
-            candidate = text[start:end]
+        end = text.rfind(']') + 1
+        if end > start_idx:
+            candidate = text[start_idx:end]
             
             try:
-                import json
                 json.loads(candidate)
                 return candidate
             except json.JSONDecodeError:
@@ -4,7 +4,7 @@ Contract models for CLAMBA
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 from typing import TYPE_CHECKING
 
 
@@ -12,6 +12,9 @@ from .process import ProcessAnalysisResult
     
 from pydantic import BaseModel, Field
 
+if TYPE_CHECKING:
+    from ..utils.sanitizer import IDSanitizer
+
 
 class ContractType(Enum):
     """Supported contract types"""
@@ -48,6 +51,26 @@ class Position(BaseModel):
     y: float = Field(..., description="Y coordinate")
 
 
+StateRole = Literal["initial", "final", "intermediate"]
+
+
+def infer_state_role(state_id: str) -> StateRole:
+    """
+    Derive a state's role from its ID
+    
+    Args:
+        state_id: State identifier
+        
+    Returns:
+        "initial", "final" or "intermediate"
+    """
+    if state_id == "state-initial":
+        return "initial"
+    if "completed" in state_id or "final" in state_id:
+        return "final"
+    return "intermediate"
+
+
 class State(BaseModel):
     """Automaton state model"""
     
@@ -60,6 +83,11 @@ class State(BaseModel):
     automata_key: Optional[str] = Field(default=None, description="Automata key")
     automate_id: Optional[str] = Field(default=None, description="Automate ID")
     execution_status: Optional[str] = Field(default=None, description="Execution status")
+    
+    @property
+    def role(self) -> StateRole:
+        """State role in the automaton, derived from the current ID"""
+        return infer_state_role(self.id)
 
 
 class Transition(BaseModel):
@@ -98,9 +126,9 @@ class Automate(BaseModel):
     @classmethod
     def from_process(
         cls, 
-        process, # Type: "Process" 
+        process: "Process",
         dependencies: List[str], 
-        sanitizer # Type: "IDSanitizer"
+        sanitizer: "IDSanitizer"
     ) -> "Automate":
         """
         Create automaton from process
@@ -113,12 +141,9 @@ class Automate(BaseModel):
         Returns:
             Automate instance
         """
-        # Import here to avoid circular imports
-        from ..utils.sanitizer import create_states_from_steps, create_transitions_from_steps
-        
         # Create states and transitions
-        states = create_states_from_steps(process.steps, sanitizer)
-        transitions = create_transitions_from_steps(process.steps, dependencies, sanitizer)
+        states = _sanitizer.create_states_from_steps(process.steps, sanitizer)
+        transitions = _sanitizer.create_transitions_from_steps(process.steps, dependencies, sanitizer)
         
         return cls(
             id=sanitizer.sanitize(process.id),
@@ -126,7 +151,7 @@ class Automate(BaseModel):
             active=False,
             states=states,
             transitions=transitions,
-            automata_dependencies=[sanitizer.sanitize(dep) for dep in dependencies],
+            automata_dependencies=sanitizer.sanitize_many(dependencies),
             execution_metadata=None
         )
     
@@ -139,11 +164,7 @@ class Automate(BaseModel):
     
     def get_final_states(self) -> List[State]:
         """Get final states"""
-        final_states = []
-        for state in self.states:
-            if "completed" in state.id or "final" in state.id:
-                final_states.append(state)
-        return final_states
+        return [state for state in self.states if state.role == "final"]
     
     def validate_structure(self) -> List[str]:
         """
@@ -159,11 +180,11 @@ class Automate(BaseModel):
             errors.append("Automaton must have at least one state")
         
         # Check if we have initial state
-        if not self.get_initial_state():
+        state_ids = {state.id for state in self.states}
+        if "state-initial" not in state_ids:
             errors.append("Automaton must have an initial state")
         
         # Check transitions reference valid states
-        state_ids = {state.id for state in self.states}
         for transition in self.transitions:
             if transition.source not in state_ids:
                 errors.append(f"Transition {transition.id} references unknown source state: {transition.source}")
@@ -232,10 +253,7 @@ class Contract(BaseModel):
         Returns:
             True if cycles detected
         """
-        from ..utils.graph import has_cycles
-        
-        dependency_graph = self.get_dependency_graph()
-        return has_cycles(dependency_graph)
+        return has_cycles(self.get_dependency_graph())
     
     def get_execution_order(self) -> List[str]:
         """
@@ -244,10 +262,7 @@ class Contract(BaseModel):
         Returns:
             List of automate IDs in execution order
         """
-        from ..utils.graph import topological_sort
-        
-        dependency_graph = self.get_dependency_graph()
-        return topological_sort(dependency_graph)
+        return topological_sort(self.get_dependency_graph())
 
 
 class ContractResult(BaseModel):
@@ -261,7 +276,7 @@ class ContractResult(BaseModel):
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
         return {
-            "contract": self.contract.dict(),
+            "contract": self.contract.model_dump(mode="json"),
             "process_analysis": {
                 "detection_method": self.process_analysis.detection_method,
                 "confidence_score": self.process_analysis.confidence_score,
@@ -288,4 +303,10 @@ class ContractResult(BaseModel):
 
 # Forward reference resolution
 from .process import Process
-ProcessAnalysisResult.model_rebuild()
\ No newline at end of file
+ProcessAnalysisResult.model_rebuild()
+
+# Bound once here rather than inside methods: clamba.utils imports these
+# models, so the sanitizer module may still be initializing at this point
+# and is only accessed through its module object at call time.
+from ..utils import sanitizer as _sanitizer
+from ..utils.graph import has_cycles, topological_sort
\ No newline at end of file
@@ -2,10 +2,12 @@
 Process models for CLAMBA
 """
 
+import re
+from collections import defaultdict
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 
 class ProcessType(Enum):
@@ -39,6 +41,59 @@ class ProcessPriority(Enum):
     CRITICAL = "critical"
 
 
+# Priority contribution to the process complexity score
+_PRIORITY_WEIGHTS = {
+    ProcessPriority.LOW: 0.0,
+    ProcessPriority.MEDIUM: 0.05,
+    ProcessPriority.HIGH: 0.1,
+    ProcessPriority.CRITICAL: 0.15,
+}
+
+# Keyword-based process type inference, in priority order
+_TYPE_KEYWORDS = {
+    ProcessType.RECEPTION: ["reception", "réception", "accueil", "receive"],
+    ProcessType.PREPARATION: ["preparation", "préparation", "setup", "prepare"],
+    ProcessType.EXECUTION: ["execution", "exécution", "perform", "execute", "do"],
+    ProcessType.VALIDATION: ["validation", "verify", "check", "approve", "confirm"],
+    ProcessType.PAYMENT: ["payment", "paiement", "pay", "billing", "invoice"],
+    ProcessType.DELIVERY: ["delivery", "livraison", "deliver", "ship", "send"],
+    ProcessType.TRANSPORT: ["transport", "shipping", "logistics", "move"],
+    ProcessType.STORAGE: ["storage", "stockage", "store", "warehouse"],
+    ProcessType.CUSTOMS: ["customs", "douane", "border", "import", "export"],
+    ProcessType.DOCUMENTATION: ["documentation", "document", "record", "report"],
+    ProcessType.QUALIFICATION: ["qualification", "qualify", "assess", "evaluate"],
+    ProcessType.MAINTENANCE: ["maintenance", "maintain", "repair", "service"],
+    ProcessType.WARRANTY: ["warranty", "garantie", "guarantee", "support"],
+}
+_RANKED_TYPES = list(_TYPE_KEYWORDS)
+
+
+def _build_type_keyword_ranks() -> Dict[str, int]:
+    """Map each keyword to the best type rank it implies"""
+    ranks: Dict[str, int] = {}
+    for rank, keywords in enumerate(_TYPE_KEYWORDS.values()):
+        for keyword in keywords:
+            ranks.setdefault(keyword, rank)
+    
+    # The regex reports one keyword per position, so a match on "document"
+    # must also account for keywords it starts with ("do")
+    return {
+        keyword: min(rank for other, rank in ranks.items() if keyword.startswith(other))
+        for keyword in ranks
+    }
+
+
+_TYPE_KEYWORD_RANKS = _build_type_keyword_ranks()
+
+# Zero-width lookahead so that overlapping keywords are all visited
+_TYPE_KEYWORD_PATTERN = re.compile(
+    "(?=(%s))" % "|".join(
+        re.escape(keyword)
+        for keyword in sorted(_TYPE_KEYWORD_RANKS, key=len, reverse=True)
+    )
+)
+
+
 class ProcessStep(BaseModel):
     """Individual step within a process"""
     
@@ -51,7 +106,8 @@ class ProcessStep(BaseModel):
     conditions: List[str] = Field(default_factory=list, description="Conditions to execute step")
     outputs: List[str] = Field(default_factory=list, description="Step outputs")
     
-    @validator("order")
+    @field_validator("order")
+    @classmethod
     def validate_order(cls, v):
         if v < 0:
             raise ValueError("Order must be non-negative")
@@ -76,7 +132,8 @@ class Process(BaseModel):
     risks: List[str] = Field(default_factory=list, description="Identified risks")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
     
-    @validator("steps")
+    @field_validator("steps")
+    @classmethod
     def validate_steps(cls, v):
         if not v:
             raise ValueError("Process must have at least one step")
@@ -147,26 +204,17 @@ class Process(BaseModel):
         """
         text = f"{name} {description}".lower()
         
-        # Simple keyword-based inference
-        type_keywords = {
-            ProcessType.RECEPTION: ["reception", "réception", "accueil", "receive"],
-            ProcessType.PREPARATION: ["preparation", "préparation", "setup", "prepare"],
-            ProcessType.EXECUTION: ["execution", "exécution", "perform", "execute", "do"],
-            ProcessType.VALIDATION: ["validation", "verify", "check", "approve", "confirm"],
-            ProcessType.PAYMENT: ["payment", "paiement", "pay", "billing", "invoice"],
-            ProcessType.DELIVERY: ["delivery", "livraison", "deliver", "ship", "send"],
-            ProcessType.TRANSPORT: ["transport", "shipping", "logistics", "move"],
-            ProcessType.STORAGE: ["storage", "stockage", "store", "warehouse"],
-            ProcessType.CUSTOMS: ["customs", "douane", "border", "import", "export"],
-            ProcessType.DOCUMENTATION: ["documentation", "document", "record", "report"],
-            ProcessType.QUALIFICATION: ["qualification", "qualify", "assess", "evaluate"],
-            ProcessType.MAINTENANCE: ["maintenance", "maintain", "repair", "service"],
-            ProcessType.WARRANTY: ["warranty", "garantie", "guarantee", "support"],
-        }
+        # Single scan over the text; keep the highest-priority type matched
+        best_rank = None
+        for match in _TYPE_KEYWORD_PATTERN.finditer(text):
+            rank = _TYPE_KEYWORD_RANKS[match.group(1)]
+            if best_rank is None or rank < best_rank:
+                best_rank = rank
+                if rank == 0:
+                    break
         
-        for process_type, keywords in type_keywords.items():
-            if any(keyword in text for keyword in keywords):
-                return process_type
+        if best_rank is not None:
+            return _RANKED_TYPES[best_rank]
         
         return ProcessType.OTHER
     
@@ -251,16 +299,15 @@ class Process(BaseModel):
             score += min(len(self.risks) / 3.0, 0.2)  # Max 0.2
         
         # Priority factor
-        priority_weights = {
-            ProcessPriority.LOW: 0.0,
-            ProcessPriority.MEDIUM: 0.05,
-            ProcessPriority.HIGH: 0.1,
-            ProcessPriority.CRITICAL: 0.15
-        }
-        score += priority_weights.get(self.priority, 0.0)
+        score += _PRIORITY_WEIGHTS.get(self.priority, 0.0)
         
         return min(score, 1.0)
     
+    @property
+    def complexity_score(self) -> float:
+        """Process complexity score (0-1), alias of get_complexity_score()"""
+        return self.get_complexity_score()
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
         return {
@@ -287,29 +334,38 @@ class ProcessAnalysisResult(BaseModel):
     confidence_score: float = Field(..., description="Confidence score (0-1)")
     analysis_time_seconds: float = Field(..., description="Analysis time in seconds")
     contract_type_detected: Optional[str] = Field(default=None, description="Detected contract type")
-    total_steps: int = Field(..., description="Total number of steps across all processes")
-    avg_complexity: float = Field(..., description="Average complexity score")
+    total_steps: int = Field(default=0, description="Total number of steps across all processes (computed if not given)")
+    avg_complexity: float = Field(default=0.0, description="Average complexity score (computed if not given)")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
     
-    @validator("confidence_score")
+    @field_validator("confidence_score")
+    @classmethod
     def validate_confidence_score(cls, v):
         if not 0.0 <= v <= 1.0:
             raise ValueError("Confidence score must be between 0 and 1")
         return v
     
-    def __init__(self, **data):
-        # Auto-calculate fields if not provided
-        if "total_steps" not in data and "processes" in data:
-            data["total_steps"] = sum(len(p.steps) for p in data["processes"])
+    @model_validator(mode="after")
+    def compute_aggregates(self) -> "ProcessAnalysisResult":
+        """Auto-calculate total_steps and avg_complexity if not provided"""
+        missing_total = "total_steps" not in self.model_fields_set
+        missing_avg = "avg_complexity" not in self.model_fields_set
+        if not (missing_total or missing_avg):
+            return self
+        
+        # Single pass over the validated processes for both aggregates
+        total_steps, complexity_sum = 0, 0.0
+        for process in self.processes:
+            total_steps += len(process.steps)
+            if missing_avg:
+                complexity_sum += process.get_complexity_score()
         
-        if "avg_complexity" not in data and "processes" in data:
-            if data["processes"]:
-                complexities = [p.get_complexity_score() for p in data["processes"]]
-                data["avg_complexity"] = sum(complexities) / len(complexities)
-            else:
-                data["avg_complexity"] = 0.0
+        if missing_total:
+            self.total_steps = total_steps
+        if missing_avg:
+            self.avg_complexity = complexity_sum / len(self.processes) if self.processes else 0.0
         
-        super().__init__(**data)
+        return self
     
     def get_summary(self) -> Dict[str, Any]:
         """Get analysis summary"""
@@ -326,13 +382,10 @@ class ProcessAnalysisResult(BaseModel):
     
     def get_processes_by_type(self) -> Dict[ProcessType, List[Process]]:
         """Group processes by type"""
-        grouped = {}
+        grouped = defaultdict(list)
         for process in self.processes:
-            process_type = process.process_type
-            if process_type not in grouped:
-                grouped[process_type] = []
-            grouped[process_type].append(process)
-        return grouped
+            grouped[process.process_type].append(process)
+        return dict(grouped)
     
     def get_high_complexity_processes(self, threshold: float = 0.7) -> List[Process]:
         """Get processes with complexity above threshold"""
@@ -6,6 +6,7 @@ from .sanitizer import IDSanitizer, create_states_from_steps, create_transitions
 from .validator import ResultValidator
 from .logger import get_logger, setup_logging
 from .graph import has_cycles, topological_sort, find_cycles, remove_cycles
+from .cache import pdf_text_cache
 
 __all__ = [
     "IDSanitizer",
@@ -19,4 +20,5 @@ __all__ = [
     "topological_sort",
     "find_cycles", 
     "remove_cycles",
+    "pdf_text_cache",
 ]
\ No newline at end of file
@@ -0,0 +1,117 @@
+"""
+On-disk caching utilities for CLAMBA
+"""
+
+import functools
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable
+
+from .logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+def get_cache_dir() -> Path:
+    """
+    Get the CLAMBA cache directory
+    
+    Returns:
+        $XDG_CACHE_HOME/clamba, or ~/.cache/clamba when unset
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "clamba"
+
+
+def file_sha256(path: Path) -> str:
+    """
+    Compute the SHA-256 hex digest of a file's content
+    
+    Args:
+        path: File to hash
+    
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def pdf_text_cache(func: Callable[..., str]) -> Callable[..., str]:
+    """
+    Cache a PDF text extraction method on disk, keyed by file content
+    
+    The decorated method is called as method(self, pdf_path). The key is the
+    SHA-256 of the PDF bytes plus the instance's optional ``cache_tag``
+    attribute (e.g. extraction backend and version), so editing the PDF or
+    changing the extractor never serves stale text. Entries are stored as
+    <cache_dir>/pdf_text/<key>.txt. Unreadable, undecodable or empty entries
+    and write failures are logged and fall back to a normal extraction.
+    Instances with a false ``use_cache`` attribute bypass the cache entirely
+    (nothing is read or written).
+    
+    Args:
+        func: Extraction method to wrap
+    
+    Returns:
+        Wrapped method
+    """
+    @functools.wraps(func)
+    def wrapper(self, pdf_path: Path) -> str:
+        pdf_path = Path(pdf_path)
+        
+        # Let the extractor raise its own errors for missing/invalid files
+        if not getattr(self, "use_cache", True) or not pdf_path.is_file():
+            return func(self, pdf_path)
+        
+        try:
+            key = file_sha256(pdf_path)
+        except OSError as e:
+            logger.debug(f"PDF cache disabled for {pdf_path}: {e}")
+            return func(self, pdf_path)
+        
+        tag = getattr(self, "cache_tag", "")
+        if tag:
+            key = f"{key}-{tag}"
+        cache_file = get_cache_dir() / "pdf_text" / f"{key}.txt"
+        
+        try:
+            text = cache_file.read_bytes().decode("utf-8")
+            if text:
+                logger.debug(f"PDF text cache hit for {pdf_path}")
+                return text
+            logger.debug(f"Ignoring empty PDF cache entry {cache_file}")
+        except FileNotFoundError:
+            pass
+        except (OSError, UnicodeDecodeError) as e:
+            logger.debug(f"Failed to read PDF cache entry {cache_file}: {e}")
+        
+        text = func(self, pdf_path)
+        
+        tmp_path = None
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # Unique temporary name: several threads may cache the same PDF
+            with tempfile.NamedTemporaryFile(
+                dir=cache_file.parent, suffix=".tmp", delete=False
+            ) as tmp_file:
+                tmp_path = tmp_file.name
+                tmp_file.write(text.encode("utf-8"))
+            os.replace(tmp_path, cache_file)
+        except OSError as e:
+            logger.debug(f"Failed to write PDF cache entry {cache_file}: {e}")
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+        
+        return text
+    
+    return wrapper
@@ -2,7 +2,8 @@
 Graph utilities for dependency analysis
 """
 
-from typing import Dict, List, Set
+from collections import deque
+from typing import Dict, List
 
 
 def has_cycles(graph: Dict[str, List[str]]) -> bool:
@@ -15,25 +16,33 @@ def has_cycles(graph: Dict[str, List[str]]) -> bool:
     Returns:
         True if cycles are detected
     """
-    def dfs(node: str, visited: Set[str], rec_stack: Set[str]) -> bool:
-        visited.add(node)
-        rec_stack.add(node)
+    # Iterative DFS with node colours: 1 = on the current path, 2 = done
+    state: Dict[str, int] = {}
+    # Nodes only seen as dependencies have no edges; the () default is a
+    # shared constant, unlike a fresh [] per miss
+    neighbors_of = graph.get
+    
+    for root in graph:
+        if state.get(root):
+            continue
         
-        for neighbor in graph.get(node, []):
-            if neighbor not in visited:
-                if dfs(neighbor, visited, rec_stack):
-                    return True
-            elif neighbor in rec_stack:
-                return True
+        state[root] = 1
+        stack = [(root, iter(graph[root]))]
         
-        rec_stack.remove(node)
-        return False
+        while stack:
+            node, neighbors = stack[-1]
+            for neighbor in neighbors:
+                neighbor_state = state.get(neighbor, 0)
+                if neighbor_state == 1:
+                    return True
+                if neighbor_state == 0:
+                    state[neighbor] = 1
+                    stack.append((neighbor, iter(neighbors_of(neighbor, ()))))
+                    break
+            else:
+                state[node] = 2
+                stack.pop()
     
-    visited = set()
-    for node in graph:
-        if node not in visited:
-            if dfs(node, visited, set()):
-                return True
     return False
 
 
@@ -45,35 +54,38 @@ def topological_sort(graph: Dict[str, List[str]]) -> List[str]:
         graph: Dictionary mapping nodes to their dependencies
         
     Returns:
-        List of nodes in topological order
+        List of nodes in topological order (dependencies first)
         
     Raises:
         ValueError: If graph has cycles
     """
-    if has_cycles(graph):
-        raise ValueError("Cannot perform topological sort on graph with cycles")
-    
-    # Calculate in-degrees
+    # In-degree = number of dependencies; reverse edges point from a
+    # dependency to the nodes waiting on it
     in_degree = {node: 0 for node in graph}
-    for node in graph:
-        for dep in graph[node]:
-            if dep in in_degree:
-                in_degree[dep] += 1
+    dependents: Dict[str, List[str]] = {node: [] for node in graph}
+    for node, deps in graph.items():
+        for dep in deps:
+            if dep in dependents:
+                dependents[dep].append(node)
+                in_degree[node] += 1
     
     # Initialize queue with nodes having no dependencies
-    queue = [node for node, degree in in_degree.items() if degree == 0]
+    queue = deque(node for node, degree in in_degree.items() if degree == 0)
     result = []
     
     while queue:
-        node = queue.pop(0)
+        node = queue.popleft()
         result.append(node)
         
-        # Update in-degrees of dependent nodes
-        for other_node, deps in graph.items():
-            if node in deps:
-                in_degree[other_node] -= 1
-                if in_degree[other_node] == 0:
-                    queue.append(other_node)
+        # Release nodes whose dependencies are now all placed
+        for dependent in dependents[node]:
+            in_degree[dependent] -= 1
+            if in_degree[dependent] == 0:
+                queue.append(dependent)
+    
+    # Nodes on a cycle never reach in-degree 0 and are left out
+    if len(result) != len(in_degree):
+        raise ValueError("Cannot perform topological sort on graph with cycles")
     
     return result
 
@@ -90,33 +102,33 @@ def find_cycles(graph: Dict[str, List[str]]) -> List[List[str]]:
     """
     cycles = []
     visited = set()
-    rec_stack = set()
-    path = []
-    
-    def dfs(node: str) -> None:
-        if node in rec_stack:
-            # Found a cycle
-            cycle_start = path.index(node)
-            cycle = path[cycle_start:] + [node]
-            cycles.append(cycle)
-            return
-        
-        if node in visited:
-            return
-        
-        visited.add(node)
-        rec_stack.add(node)
-        path.append(node)
+    neighbors_of = graph.get
+    
+    for root in graph:
+        if root in visited:
+            continue
         
-        for neighbor in graph.get(node, []):
-            dfs(neighbor)
+        # Current DFS path, each node's index in it, and one neighbour
+        # iterator per path entry
+        visited.add(root)
+        path = [root]
+        position = {root: 0}
+        iterators = [iter(graph[root])]
         
-        rec_stack.remove(node)
-        path.pop()
-    
-    for node in graph:
-        if node not in visited:
-            dfs(node)
+        while iterators:
+            for neighbor in iterators[-1]:
+                if neighbor in position:
+                    # Found a cycle
+                    cycles.append(path[position[neighbor]:] + [neighbor])
+                elif neighbor not in visited:
+                    visited.add(neighbor)
+                    position[neighbor] = len(path)
+                    path.append(neighbor)
+                    iterators.append(iter(neighbors_of(neighbor, ())))
+                    break
+            else:
+                iterators.pop()
+                del position[path.pop()]
     
     return cycles
 
@@ -133,15 +145,30 @@ def remove_cycles(graph: Dict[str, List[str]]) -> Dict[str, List[str]]:
     """
     clean_graph = {node: [] for node in graph}
     
-    # Add edges one by one, checking for cycles
+    # Add edges one by one; node -> dep closes a cycle only if dep can
+    # already reach node in the (acyclic) graph built so far
     for node, deps in graph.items():
         for dep in deps:
-            # Create temporary graph with this edge
-            temp_graph = {k: v.copy() for k, v in clean_graph.items()}
-            temp_graph[node].append(dep)
-            
-            # If no cycle is created, keep the edge
-            if not has_cycles(temp_graph):
+            if not _reaches(clean_graph, dep, node):
                 clean_graph[node].append(dep)
     
-    return clean_graph
\ No newline at end of file
+    return clean_graph
+
+
+def _reaches(graph: Dict[str, List[str]], source: str, target: str) -> bool:
+    """Check whether target is reachable from source (iterative DFS)"""
+    if source == target:
+        return True
+    
+    neighbors_of = graph.get
+    seen = {source}
+    stack = [source]
+    while stack:
+        for neighbor in neighbors_of(stack.pop(), ()):
+            if neighbor == target:
+                return True
+            if neighbor not in seen:
+                seen.add(neighbor)
+                stack.append(neighbor)
+    
+    return False
@@ -4,7 +4,18 @@ Logging utilities for CLAMBA
 
 import logging
 import sys
-from typing import Optional
+from typing import Dict, Optional, Tuple
+
+
+# Formatters are stateless, so every CLAMBA logger shares these two
+_FMT_DEBUG = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s"
+)
+_FMT_INFO = logging.Formatter(
+    "%(asctime)s - %(levelname)s - %(message)s"
+)
+
+_LOGGER_CACHE: Dict[Tuple[str, bool], logging.Logger] = {}
 
 
 def get_logger(name: str, debug: bool = False) -> logging.Logger:
@@ -18,7 +29,12 @@ def get_logger(name: str, debug: bool = False) -> logging.Logger:
     Returns:
         Configured logger
     """
+    cached = _LOGGER_CACHE.get((name, debug))
+    if cached is not None:
+        return cached
+    
     logger = logging.getLogger(name)
+    _LOGGER_CACHE[(name, debug)] = logger
     
     # Avoid adding multiple handlers
     if logger.handlers:
@@ -29,17 +45,12 @@ def get_logger(name: str, debug: bool = False) -> logging.Logger:
     
     # Set format
     if debug:
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s"
-        )
+        handler.setFormatter(_FMT_DEBUG)
         logger.setLevel(logging.DEBUG)
     else:
-        formatter = logging.Formatter(
-            "%(asctime)s - %(levelname)s - %(message)s"
-        )
+        handler.setFormatter(_FMT_INFO)
         logger.setLevel(logging.INFO)
     
-    handler.setFormatter(formatter)
     logger.addHandler(handler)
     
     return logger
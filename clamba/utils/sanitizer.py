@@ -4,11 +4,76 @@ ID Sanitization utilities for CLAMBA
 
 import re
 import unicodedata
-from typing import List
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
 
 from ..models.contract import Position, State, Transition
 
 
+_NON_ALNUM_PATTERN = re.compile(r'[^a-z0-9]+')
+_HYPHENS_PATTERN = re.compile(r'-+')
+# Lowercase alphanumerics separated by single hyphens, no leading/trailing hyphen
+_VALID_ID_PATTERN = re.compile(r'[a-z0-9]+(?:-[a-z0-9]+)*')
+# Transition labels use underscores where IDs use hyphens
+_HYPHEN_TO_UNDERSCORE = str.maketrans('-', '_')
+
+
+class _CombiningMarkFilter(dict):
+    """
+    str.translate table deleting combining marks (category Mn)
+    
+    Filled lazily: each code point's category is looked up once, later
+    occurrences are plain dict hits inside translate.
+    """
+    
+    __slots__ = ()
+    
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        value = None if unicodedata.category(chr(codepoint)) == 'Mn' else codepoint
+        self[codepoint] = value
+        return value
+
+
+_STRIP_COMBINING_MARKS = _CombiningMarkFilter()
+
+
+@lru_cache(maxsize=1024)
+def _sanitize(text: str, max_length: int) -> str:
+    """
+    Sanitization pipeline behind IDSanitizer.sanitize, memoized per max_length
+    
+    Args:
+        text: Non-empty text to sanitize
+        max_length: Maximum length for the generated ID
+        
+    Returns:
+        Clean ID string
+    """
+    # Step 1: Normalize accents (pure ASCII has nothing to decompose)
+    if not text.isascii():
+        text = unicodedata.normalize('NFD', text).translate(_STRIP_COMBINING_MARKS)
+    
+    # Step 2: Convert to lowercase
+    text = text.lower()
+    
+    # Step 3: Replace spaces and special characters with hyphens
+    text = _NON_ALNUM_PATTERN.sub('-', text)
+    
+    # Step 4: Clean multiple hyphens and trim
+    text = _HYPHENS_PATTERN.sub('-', text)
+    text = text.strip('-')
+    
+    # Step 5: Limit length
+    if len(text) > max_length:
+        text = text[:max_length].rstrip('-')
+    
+    # Step 6: Ensure we have something
+    if not text:
+        text = "sanitized-id"
+    
+    return text
+
+
 class IDSanitizer:
     """
     Universal ID sanitizer for generating clean identifiers
@@ -16,6 +81,8 @@ class IDSanitizer:
     Transforms any text into clean IDs without accents or special characters
     """
     
+    __slots__ = ("max_length", "_step_cache")
+    
     def __init__(self, max_length: int = 50):
         """
         Initialize sanitizer
@@ -24,6 +91,7 @@ class IDSanitizer:
             max_length: Maximum length for generated IDs
         """
         self.max_length = max_length
+        self._step_cache: Dict[str, str] = {}
     
     def sanitize(self, text: str) -> str:
         """
@@ -38,29 +106,20 @@ class IDSanitizer:
         if not text:
             return "default_id"
         
-        # Step 1: Normalize accents
-        text = unicodedata.normalize('NFD', str(text))
-        text = ''.join(c for c in text if unicodedata.category(c) != 'Mn')
-        
-        # Step 2: Convert to lowercase
-        text = text.lower()
-        
-        # Step 3: Replace spaces and special characters with hyphens
-        text = re.sub(r'[^a-z0-9]+', '-', text)
-        
-        # Step 4: Clean multiple hyphens and trim
-        text = re.sub(r'-+', '-', text)
-        text = text.strip('-')
-        
-        # Step 5: Limit length
-        if len(text) > self.max_length:
-            text = text[:self.max_length].rstrip('-')
-        
-        # Step 6: Ensure we have something
-        if not text:
-            text = "sanitized-id"
+        return _sanitize(str(text), self.max_length)
+    
+    def sanitize_many(self, texts: Iterable[str]) -> List[str]:
+        """
+        Sanitize several texts in one call
         
-        return text
+        Args:
+            texts: Texts to sanitize
+            
+        Returns:
+            List of clean ID strings, in input order
+        """
+        sanitize = self.sanitize
+        return [sanitize(text) for text in texts]
     
     def sanitize_step_name(self, step: str) -> str:
         """
@@ -72,7 +131,12 @@ class IDSanitizer:
         Returns:
             Sanitized step name
         """
-        return self.sanitize(step.replace('_', ' '))
+        cache = self._step_cache
+        sanitized = cache.get(step)
+        if sanitized is None:
+            sanitized = self.sanitize(step.replace('_', ' '))
+            cache[step] = sanitized
+        return sanitized
 
 
 def create_states_from_steps(steps: List[str], sanitizer: IDSanitizer) -> List[State]:
@@ -86,13 +150,15 @@ def create_states_from_steps(steps: List[str], sanitizer: IDSanitizer) -> List[S
     Returns:
         List of State objects
     """
+    # Fields are built here from already-sanitized values, so the models are
+    # constructed without validation
     states = []
     
     # Initial state
-    states.append(State(
+    states.append(State.model_construct(
         id="state-initial",
         label="INITIAL",
-        position=Position(x=80.0, y=80.0),
+        position=Position.model_construct(x=80.0, y=80.0),
         type="default",
         source_position="bottom",
         target_position="top"
@@ -102,20 +168,20 @@ def create_states_from_steps(steps: List[str], sanitizer: IDSanitizer) -> List[S
     for i, step in enumerate(steps):
         sanitized_step = sanitizer.sanitize_step_name(step)
         
-        states.append(State(
+        states.append(State.model_construct(
             id=f"state-{sanitized_step}",
             label=step.replace('_', ' ').title(),
-            position=Position(x=80.0, y=180.0 + (i * 100)),
+            position=Position.model_construct(x=80.0, y=180.0 + (i * 100)),
             type="default",
             source_position="bottom",
             target_position="top"
         ))
     
     # Final state
-    states.append(State(
+    states.append(State.model_construct(
         id="state-completed",
         label="COMPLETED",
-        position=Position(x=320.0, y=180.0 + (len(steps) * 100)),
+        position=Position.model_construct(x=320.0, y=180.0 + (len(steps) * 100)),
         type="default",
         source_position="bottom",
         target_position="top"
@@ -140,45 +206,49 @@ def create_transitions_from_steps(
     Returns:
         List of Transition objects
     """
+    # Built from already-sanitized values, so validation is skipped
     transitions = []
     
     if not steps:
         return transitions
     
+    sanitized_steps = [sanitizer.sanitize_step_name(step) for step in steps]
+    step_labels = [step.translate(_HYPHEN_TO_UNDERSCORE) for step in sanitized_steps]
+    
     # Initial transition
-    first_step_sanitized = sanitizer.sanitize_step_name(steps[0])
-    transitions.append(Transition(
+    first_step_sanitized = sanitized_steps[0]
+    transitions.append(Transition.model_construct(
         id=f"edge-initial-to-{first_step_sanitized}",
         source="state-initial",
         target=f"state-{first_step_sanitized}",
-        label=f"initial_to_{first_step_sanitized.replace('-', '_')}",
+        label=f"initial_to_{step_labels[0]}",
         marker_end="arrowclosed",
         conditions=[],
-        automata_dependencies=[sanitizer.sanitize(dep) for dep in dependencies]
+        automata_dependencies=sanitizer.sanitize_many(dependencies)
     ))
     
     # Transitions between steps
     for i in range(len(steps) - 1):
-        current_step_sanitized = sanitizer.sanitize_step_name(steps[i])
-        next_step_sanitized = sanitizer.sanitize_step_name(steps[i + 1])
+        current_step_sanitized = sanitized_steps[i]
+        next_step_sanitized = sanitized_steps[i + 1]
         
-        transitions.append(Transition(
+        transitions.append(Transition.model_construct(
             id=f"edge-{current_step_sanitized}-to-{next_step_sanitized}",
             source=f"state-{current_step_sanitized}",
             target=f"state-{next_step_sanitized}",
-            label=f"{current_step_sanitized.replace('-', '_')}_to_{next_step_sanitized.replace('-', '_')}",
+            label=f"{step_labels[i]}_to_{step_labels[i + 1]}",
             marker_end="arrowclosed",
             conditions=[],
             automata_dependencies=[]
         ))
     
     # Final transition
-    last_step_sanitized = sanitizer.sanitize_step_name(steps[-1])
-    transitions.append(Transition(
+    last_step_sanitized = sanitized_steps[-1]
+    transitions.append(Transition.model_construct(
         id=f"edge-{last_step_sanitized}-to-completed",
         source=f"state-{last_step_sanitized}",
         target="state-completed",
-        label=f"{last_step_sanitized.replace('-', '_')}_to_completed",
+        label=f"{step_labels[-1]}_to_completed",
         marker_end="arrowclosed",
         conditions=[],
         automata_dependencies=[]
@@ -200,20 +270,7 @@ def validate_id(id_string: str) -> bool:
     if not id_string:
         return False
     
-    # Check if ID only contains lowercase letters, numbers, and hyphens
-    pattern = re.compile(r'^[a-z0-9-]+$')
-    if not pattern.match(id_string):
-        return False
-    
-    # Check if ID doesn't start or end with hyphen
-    if id_string.startswith('-') or id_string.endswith('-'):
-        return False
-    
-    # Check for consecutive hyphens
-    if '--' in id_string:
-        return False
-    
-    return True
+    return _VALID_ID_PATTERN.fullmatch(id_string) is not None
 
 
 def generate_unique_id(base_id: str, existing_ids: set, sanitizer: IDSanitizer) -> str:
@@ -247,10 +304,14 @@ class IDRegistry:
     Registry for tracking used IDs and ensuring uniqueness
     """
     
+    __slots__ = ("used_ids", "sanitizer", "_next_suffix")
+    
     def __init__(self):
         """Initialize empty registry"""
         self.used_ids: set = set()
         self.sanitizer = IDSanitizer()
+        # Per sanitized base, first counter suffix not yet known to be taken
+        self._next_suffix: Dict[str, int] = {}
     
     def register_id(self, base_id: str) -> str:
         """
@@ -262,9 +323,23 @@ class IDRegistry:
         Returns:
             Unique registered ID
         """
-        unique_id = generate_unique_id(base_id, self.used_ids, self.sanitizer)
-        self.used_ids.add(unique_id)
-        return unique_id
+        used_ids = self.used_ids
+        base = self.sanitizer.sanitize(base_id)
+        
+        if base not in used_ids:
+            used_ids.add(base)
+            return base
+        
+        # IDs are never released, so every suffix below the stored counter
+        # is still taken and probing can resume where it last stopped
+        counter = self._next_suffix.get(base, 1)
+        while True:
+            candidate = f"{base}-{counter}"
+            counter += 1
+            if candidate not in used_ids:
+                self._next_suffix[base] = counter
+                used_ids.add(candidate)
+                return candidate
     
     def is_available(self, id_string: str) -> bool:
         """
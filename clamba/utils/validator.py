@@ -34,8 +34,8 @@ class ResultValidator:
         
         # Validate automates
         for automate in contract.automates:
-            automate_errors = automate.validate_structure()
-            errors.extend([f"Automate {automate.id}: {error}" for error in automate_errors])
+            automate_id = automate.id
+            errors.extend(f"Automate {automate_id}: {error}" for error in automate.validate_structure())
         
         # Validate dependencies
         dependency_errors = contract.validate_dependencies()
@@ -6,9 +6,32 @@ Génère un format SLCA épuré avec dépendances intégrées dans les transitio
 
 import json
 import argparse
+import itertools
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson est optionnel, repli sur json standard
+    orjson = None
+
+
+def _load_json(path: Path) -> Any:
+    """Lit un fichier JSON (orjson si disponible)"""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_bytes())
+
+
+def _dump_json(data: Any, path: Path) -> None:
+    """Écrit un fichier JSON indenté (orjson si disponible)"""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    # Encodage en mémoire puis une seule écriture binaire
+    path.write_bytes(json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8'))
 
 
 class CLAMBAtoSLCASimpleConverter:
@@ -44,21 +67,12 @@ class CLAMBAtoSLCASimpleConverter:
         for automate in automates:
             automate_id = automate.get("id", "unknown")
             
-            # Extraire les dépendances pour cet automate
-            dependencies = []
-            
-            # Dépendances depuis l'automate lui-même
-            automate_deps = automate.get("automata_dependencies", [])
-            if automate_deps:
-                dependencies.extend(automate_deps)
-            
-            # Dépendances depuis les dépendances globales
-            global_deps = global_dependencies.get(automate_id, [])
-            if global_deps:
-                dependencies.extend(global_deps)
-            
-            # Supprimer les doublons
-            dependencies = list(set(dependencies))
+            # Dépendances de l'automate puis dépendances globales, fusionnées en
+            # une passe sans doublons et dans l'ordre d'origine
+            dependencies = list(dict.fromkeys(itertools.chain(
+                automate.get("automata_dependencies", ()),
+                global_dependencies.get(automate_id, ())
+            )))
             
             converted_automate = {
                 "id": automate.get("id", "unknown"),
@@ -103,10 +117,30 @@ class CLAMBAtoSLCASimpleConverter:
         
         return converted_states
     
-    def _convert_transitions(self, transitions: List[Dict[str, Any]], automate_dependencies: List[str]) -> List[Dict[str, Any]]:
-        """Convertit les transitions en intégrant les dépendances sur la première"""
+    def _convert_transitions(
+        self,
+        transitions: List[Dict[str, Any]],
+        automate_dependencies: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Convertit les transitions en intégrant les dépendances sur la première
+        
+        Les noms de champs (snake_case ou camelCase) sont conservés transition
+        par transition, les fichiers pouvant mélanger les deux conventions.
+        """
         converted_transitions = []
         
+        # Nom du champ des dépendances injectées sur la première transition :
+        # snake_case s'il apparaît dans une transition, sinon camelCase s'il
+        # apparaît, sinon snake_case par défaut (une seule passe)
+        injected_dep_key = "automata_dependencies"
+        if automate_dependencies:
+            for transition in transitions:
+                if "automata_dependencies" in transition:
+                    injected_dep_key = "automata_dependencies"
+                    break
+                if "automataDependencies" in transition:
+                    injected_dep_key = "automataDependencies"
+        
         for i, transition in enumerate(transitions):
             converted_transition = {
                 "id": transition.get("id", "unknown"),
@@ -115,7 +149,7 @@ class CLAMBAtoSLCASimpleConverter:
                 "label": transition.get("label", "transition"),
             }
             
-            # Ajouter marker_end ou markerEnd selon le format d'origine
+            # Garder le marqueur existant, avec le nom de champ d'origine
             if "marker_end" in transition:
                 converted_transition["marker_end"] = transition["marker_end"]
             elif "markerEnd" in transition:
@@ -128,34 +162,29 @@ class CLAMBAtoSLCASimpleConverter:
             
             # IMPORTANT: Intégrer les dépendances sur la PREMIÈRE transition
             if i == 0 and automate_dependencies:
-                # Utiliser le bon nom de champ selon le format d'origine
-                if any("automata_dependencies" in t for t in transitions):
-                    converted_transition["automata_dependencies"] = automate_dependencies
-                elif any("automataDependencies" in t for t in transitions):
-                    converted_transition["automataDependencies"] = automate_dependencies
-                else:
-                    converted_transition["automata_dependencies"] = automate_dependencies
+                converted_transition[injected_dep_key] = automate_dependencies
             else:
-                # Autres transitions : pas de dépendances ou garder celles existantes
-                if "automata_dependencies" in transition:
-                    dep_value = transition["automata_dependencies"]
-                    if dep_value:  # Seulement si non vide
-                        converted_transition["automata_dependencies"] = dep_value
-                elif "automataDependencies" in transition:
-                    dep_value = transition["automataDependencies"]
-                    if dep_value:  # Seulement si non vide
-                        converted_transition["automataDependencies"] = dep_value
+                # Autres transitions : garder les dépendances existantes non vides
+                dep_key = "automata_dependencies" if "automata_dependencies" in transition else "automataDependencies"
+                dep_value = transition.get(dep_key)
+                if dep_value:
+                    converted_transition[dep_key] = dep_value
             
             converted_transitions.append(converted_transition)
         
         return converted_transitions
     
-    def convert_file(self, input_file: Path, output_file: Optional[Path] = None) -> Path:
-        """Convertit un fichier CLAMBA vers SLCA simplifié"""
+    def convert_file(
+        self, input_file: Path, output_file: Optional[Path] = None
+    ) -> Tuple[Path, Dict[str, Any], Dict[str, Any]]:
+        """Convertit un fichier CLAMBA vers SLCA simplifié
+        
+        Retourne le fichier de sortie ainsi que les données CLAMBA et SLCA,
+        pour que print_summary n'ait pas à relire les fichiers.
+        """
         
         # Lire le fichier CLAMBA
-        with open(input_file, 'r', encoding='utf-8') as f:
-            clamba_data = json.load(f)
+        clamba_data = _load_json(input_file)
         
         # Convertir vers SLCA simplifié
         slca_data = self.convert_contract(clamba_data)
@@ -165,20 +194,18 @@ class CLAMBAtoSLCASimpleConverter:
             output_file = input_file.parent / f"{input_file.stem}_slca.json"
         
         # Sauvegarder le fichier SLCA
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(slca_data, f, indent=2, ensure_ascii=False)
+        _dump_json(slca_data, output_file)
         
-        return output_file
+        return output_file, clamba_data, slca_data
     
-    def print_summary(self, input_file: Path, output_file: Path):
-        """Affiche un résumé de la conversion"""
-        
-        # Lire les fichiers pour les statistiques
-        with open(input_file, 'r', encoding='utf-8') as f:
-            clamba_data = json.load(f)
-        
-        with open(output_file, 'r', encoding='utf-8') as f:
-            slca_data = json.load(f)
+    def print_summary(
+        self,
+        input_file: Path,
+        output_file: Path,
+        clamba_data: Dict[str, Any],
+        slca_data: Dict[str, Any]
+    ):
+        """Affiche un résumé de la conversion à partir des données déjà chargées"""
         
         print(f"✅ Conversion CLAMBA → SLCA réussie")
         print(f"📁 Fichier d'entrée: {input_file}")
@@ -197,7 +224,6 @@ class CLAMBAtoSLCASimpleConverter:
         print(f"📊 Dépendances intégrées: {total_deps}")
         
         # Taille des fichiers
-        import os
         original_size = os.path.getsize(input_file)
         slca_size = os.path.getsize(output_file)
         reduction = ((original_size - slca_size) / original_size) * 100
@@ -227,14 +253,14 @@ def main():
     converter = CLAMBAtoSLCASimpleConverter()
     
     try:
-        output_file = converter.convert_file(
+        output_file, clamba_data, slca_data = converter.convert_file(
             input_file, 
             Path(args.output) if args.output else None
         )
         
         if not args.quiet:
             if args.verbose:
-                converter.print_summary(input_file, output_file)
+                converter.print_summary(input_file, output_file, clamba_data, slca_data)
             else:
                 print(f"✅ Fichier SLCA généré: {output_file}")
             
@@ -3,48 +3,75 @@
 Debug CLAMBA - Voir la réponse brute de l'IA
 """
 
+import json
+import re
+from typing import Optional
+
 from clamba.core.pdf_extractor import PDFExtractor
 from clamba.ai.factory import AIProviderFactory
-from clamba.config.settings import CLAMBAConfig
+from clamba.config.settings import load_config_cached
 from pathlib import Path
 
-def debug_ai_response():
-    """Déboguer la réponse de l'IA"""
+# Du premier '[' au dernier ']' de la réponse
+JSON_ARRAY_PATTERN = re.compile(r'\[.*\]', re.DOTALL)
+
+SIMPLE_PROMPT = """Réponds uniquement avec ce JSON exact:
+[
+  {
+    "id": "01",
+    "name": "Test Process",
+    "description": "Un processus de test",
+    "steps": ["step1", "step2", "step3"],
+    "responsible_party": "Test",
+    "triggers": "Test trigger"
+  }
+]"""
+
+def debug_ai_response() -> bool:
+    """Déboguer la réponse de l'IA
+    
+    Returns:
+        True si le prompt simple a été envoyé avec le prompt d'analyse
+    """
     
     print("🔍 DEBUG CLAMBA - Réponse IA")
     print("=" * 50)
     
     # Charger config
-    config = CLAMBAConfig.from_file("clamba_config.yaml")
+    config = load_config_cached("clamba_config.yaml")
     print(f"✅ Config: {config.ai.provider}")
     
     # Extraire le texte du PDF
     pdf_path = Path("tests/contrat_prestation_service_voiture.pdf")
-    extractor = PDFExtractor()
+    extractor = PDFExtractor(skip_graphics_heavy=True)
     
     try:
-        contract_text = extractor.extract_text(pdf_path)
-        print(f"✅ PDF extrait: {len(contract_text)} caractères")
+        # Seuls les 2000 premiers caractères partent dans le prompt :
+        # on arrête l'extraction dès qu'on en a assez (avec une marge)
+        contract_text = "".join(extractor.extract_text_stream(pdf_path, max_chars=2500)).strip()
+        if not contract_text:
+            raise ValueError("Aucun texte extrait du PDF")
+        print(f"✅ PDF extrait: {len(contract_text)} caractères (début du contrat)")
         print("\n📄 EXTRAIT DU CONTRAT:")
         print("-" * 30)
         print(contract_text[:500] + "..." if len(contract_text) > 500 else contract_text)
         print("-" * 30)
     except Exception as e:
         print(f"❌ Erreur extraction PDF: {e}")
-        return
+        return False
     
     # Initialiser l'IA
     try:
-        ai_provider = AIProviderFactory.create_provider(config)
+        ai_provider = AIProviderFactory.get_provider_cached(config)
         print(f"✅ Provider IA: {ai_provider.get_provider_name()}")
     except Exception as e:
         print(f"❌ Erreur provider IA: {e}")
-        return
+        return False
     
     # Tester la connexion
     if not ai_provider.test_connection():
         print("❌ Connexion IA échouée")
-        return
+        return False
     
     print("✅ Connexion IA OK")
     
@@ -81,24 +108,27 @@ ANALYSER LE CONTRAT ET IDENTIFIER LES PROCESSUS:"""
     print(prompt[-500:])  # Derniers 500 chars
     print("-" * 30)
     
-    # Envoyer le prompt
+    # Envoyer le prompt d'analyse et le prompt simple en parallèle
+    print("\n🤖 Envoi à l'IA (2 prompts en parallèle)... (peut prendre 30-60s)")
+    try:
+        response, simple_response = ai_provider.query_batch([prompt, SIMPLE_PROMPT])
+    except Exception as e:
+        print(f"❌ Erreur requête IA: {e}")
+        return False
+    
     try:
-        print("\n🤖 Envoi à l'IA... (peut prendre 30-60s)")
-        response = ai_provider.query(prompt)
-        
         print(f"\n📥 RÉPONSE BRUTE IA ({len(response)} caractères):")
         print("=" * 50)
         print(response)
         print("=" * 50)
         
         # Analyser la réponse
-        if "[" in response and "]" in response:
+        match = JSON_ARRAY_PATTERN.search(response)
+        if match:
             print("✅ JSON array détecté dans la réponse")
             
-            # Essayer d'extraire le JSON
-            start = response.find('[')
-            end = response.rfind(']') + 1
-            json_part = response[start:end]
+            # Extraire le JSON
+            json_part = match.group(0)
             
             print(f"\n📦 JSON EXTRAIT:")
             print("-" * 30)
@@ -107,7 +137,6 @@ ANALYSER LE CONTRAT ET IDENTIFIER LES PROCESSUS:"""
             
             # Essayer de parser
             try:
-                import json
                 data = json.loads(json_part)
                 print(f"✅ JSON valide: {len(data)} processus détectés")
                 for i, proc in enumerate(data, 1):
@@ -119,43 +148,42 @@ ANALYSER LE CONTRAT ET IDENTIFIER LES PROCESSUS:"""
             print("\n💡 L'IA n'a pas respecté le format demandé")
         
     except Exception as e:
-        print(f"❌ Erreur requête IA: {e}")
+        print(f"❌ Erreur analyse réponse IA: {e}")
+    
+    test_simple_prompt(simple_response)
+    return True
 
-def test_simple_prompt():
-    """Test avec un prompt ultra-simple"""
+def test_simple_prompt(response: Optional[str] = None):
+    """Test avec un prompt ultra-simple
+    
+    Args:
+        response: Réponse déjà obtenue dans le même lot que le prompt
+            d'analyse ; sinon le prompt est envoyé seul, indépendamment du PDF
+    """
     
     print("\n" + "=" * 50)
     print("🧪 TEST PROMPT SIMPLE")
     print("=" * 50)
     
-    config = CLAMBAConfig.from_file("clamba_config.yaml")
-    ai_provider = AIProviderFactory.create_provider(config)
+    if response is None:
+        print("📝 Prompt simple envoyé...")
+        try:
+            config = load_config_cached("clamba_config.yaml")
+            ai_provider = AIProviderFactory.get_provider_cached(config)
+            response = ai_provider.query(SIMPLE_PROMPT)
+        except Exception as e:
+            print(f"❌ Erreur: {e}")
+            return
     
-    simple_prompt = """Réponds uniquement avec ce JSON exact:
-[
-  {
-    "id": "01",
-    "name": "Test Process",
-    "description": "Un processus de test",
-    "steps": ["step1", "step2", "step3"],
-    "responsible_party": "Test",
-    "triggers": "Test trigger"
-  }
-]"""
+    print(f"📥 Réponse: {response}")
     
-    print("📝 Prompt simple envoyé...")
-    try:
-        response = ai_provider.query(simple_prompt)
-        print(f"📥 Réponse: {response}")
-        
-        if "[" in response and "]" in response:
-            print("✅ Format JSON détecté")
-        else:
-            print("❌ Format JSON non détecté")
-            
-    except Exception as e:
-        print(f"❌ Erreur: {e}")
+    if "[" in response and "]" in response:
+        print("✅ Format JSON détecté")
+    else:
+        print("❌ Format JSON non détecté")
 
 if __name__ == "__main__":
-    debug_ai_response()
-    test_simple_prompt()
\ No newline at end of file
+    # Le prompt simple reste un diagnostic du provider indépendant du PDF : il est
+    # envoyé seul si le débogage complet s'est arrêté avant
+    if not debug_ai_response():
+        test_simple_prompt()
\ No newline at end of file
@@ -3,9 +3,43 @@
 Test d'installation CLAMBA - Version complète
 """
 
+import argparse
+import io
 import sys
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Tests indépendants exécutés en parallèle (après test_imports)
+MAX_WORKERS = 4
+
+
+class _ThreadLocalStdout:
+    """Proxy de sys.stdout : chaque thread de test écrit dans son propre tampon"""
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+    
+    def capture(self) -> io.StringIO:
+        buffer = io.StringIO()
+        self._local.buffer = buffer
+        return buffer
+    
+    def release(self):
+        self._local.buffer = None
+    
+    def write(self, text):
+        buffer = getattr(self._local, "buffer", None)
+        return (self._stream if buffer is None else buffer).write(text)
+    
+    def flush(self):
+        self._stream.flush()
+    
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
 def test_imports():
     """Test des imports de base"""
     print("🔍 Test des imports...")
@@ -265,7 +299,26 @@ def test_complete_workflow():
         print(f"❌ Erreur workflow: {e}")
         return False
 
-def main():
+def _run_test(test_name, test_func, verbose=False) -> bool:
+    """Exécute un test en transformant une exception en échec"""
+    try:
+        return test_func()
+    except Exception as e:
+        print(f"❌ Erreur critique dans {test_name}: {e!r}")
+        if verbose:
+            print(f"   Détails: {traceback.format_exc()}")
+        return False
+
+def _run_captured(test_name, test_func, stdout_proxy, verbose=False):
+    """Exécute un test dans un thread en capturant sa sortie"""
+    buffer = stdout_proxy.capture()
+    try:
+        success = _run_test(test_name, test_func, verbose)
+    finally:
+        stdout_proxy.release()
+    return success, buffer.getvalue()
+
+def main(verbose=False):
     """Test principal"""
     print("🚀 CLAMBA - Test d'installation complet")
     print("=" * 60)
@@ -282,17 +335,26 @@ def main():
         ("Workflow complet", test_complete_workflow),
     ]
     
-    results = []
+    # Les imports d'abord, seuls : ils chargent le package pour les autres
+    (first_name, first_func), *parallel_tests = tests
+    results = [(first_name, _run_test(first_name, first_func, verbose))]
     
-    for test_name, test_func in tests:
-        try:
-            success = test_func()
-            results.append((test_name, success))
-        except Exception as e:
-            print(f"❌ Erreur critique dans {test_name}: {e}")
-            import traceback
-            print(f"   Détails: {traceback.format_exc()}")
-            results.append((test_name, False))
+    # Puis les tests indépendants en parallèle, chacun avec sa sortie capturée
+    # et affichée d'un bloc, dans l'ordre de la liste
+    stdout_proxy = _ThreadLocalStdout(sys.stdout)
+    sys.stdout = stdout_proxy
+    try:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = [
+                (test_name, executor.submit(_run_captured, test_name, test_func, stdout_proxy, verbose))
+                for test_name, test_func in parallel_tests
+            ]
+            for test_name, future in futures:
+                success, output = future.result()
+                print(output, end="")
+                results.append((test_name, success))
+    finally:
+        sys.stdout = stdout_proxy._stream
     
     # Résumé
     print("\n" + "=" * 60)
@@ -340,14 +402,21 @@ def main():
     return 0
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Test d'installation CLAMBA")
+    parser.add_argument(
+        "-v", "--verbose", action="store_true",
+        help="Afficher la trace complète des erreurs"
+    )
+    args = parser.parse_args()
+    
     try:
-        exit_code = main()
+        exit_code = main(verbose=args.verbose)
         sys.exit(exit_code)
     except KeyboardInterrupt:
         print("\n\n❌ Test interrompu par l'utilisateur")
         sys.exit(1)
     except Exception as e:
-        print(f"\n\n❌ Erreur critique: {e}")
-        import traceback
-        traceback.print_exc()
+        print(f"\n\n❌ Erreur critique: {e!r}")
+        if args.verbose:
+            traceback.print_exc()
         sys.exit(1)
\ No newline at end of file